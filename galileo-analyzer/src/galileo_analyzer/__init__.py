@@ -0,0 +1,4 @@
+import logging
+
+# Library default: log records are dropped unless the application configures handlers
+logging.getLogger("galileo").addHandler(logging.NullHandler())
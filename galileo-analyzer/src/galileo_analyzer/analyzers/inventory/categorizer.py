@@ -1,7 +1,23 @@
+from bisect import bisect_left
 from datetime import datetime
-from typing import Dict, List, Any
+from operator import itemgetter
+from typing import Dict, List
 from ...core.models import IdleAnalysis, JobCategory, Priority, CostEstimate, QuickCodeAnalysis, TagsInfo
 
+_INACTIVE_CATEGORIES = frozenset({JobCategory.ABANDONED, JobCategory.INACTIVE})
+_NON_PROD_ENVIRONMENTS = frozenset({'dev', 'test'})
+_STARTED_ON = itemgetter('StartedOn')
+
+# Upper bounds (inclusive, in days) for each idle bucket, paired by index with
+# the (category, priority) it maps to; anything past the last bound is abandoned
+_IDLE_THRESHOLDS = (7, 30, 90)
+_IDLE_BUCKETS = (
+    (JobCategory.ACTIVE, Priority.LOW),
+    (JobCategory.RECENT, Priority.LOW),
+    (JobCategory.INACTIVE, Priority.MEDIUM),
+    (JobCategory.ABANDONED, Priority.HIGH),
+)
+
 class JobCategorizer:
     
     @staticmethod
@@ -19,18 +35,11 @@ class JobCategorizer:
                 last_run_status=None
             )
         
-        last_run = max(job_runs, key=lambda x: x['StartedOn'])
+        last_run = max(job_runs, key=_STARTED_ON)
         last_run_time = last_run['StartedOn'].replace(tzinfo=None)
         days_idle = (now - last_run_time).days
         
-        if days_idle <= 7:
-            category, priority = JobCategory.ACTIVE, Priority.LOW
-        elif days_idle <= 30:
-            category, priority = JobCategory.RECENT, Priority.LOW
-        elif days_idle <= 90:
-            category, priority = JobCategory.INACTIVE, Priority.MEDIUM
-        else:
-            category, priority = JobCategory.ABANDONED, Priority.HIGH
+        category, priority = _IDLE_BUCKETS[bisect_left(_IDLE_THRESHOLDS, days_idle)]
         
         return IdleAnalysis(
             category=category,
@@ -52,13 +61,13 @@ class JobCategorizer:
         return {
             'high_cost': cost_estimate.estimated_monthly_brl > 500,
             'inactive_expensive': (
-                idle_analysis.category in [JobCategory.ABANDONED, JobCategory.INACTIVE] and 
+                idle_analysis.category in _INACTIVE_CATEGORIES and 
                 cost_estimate.estimated_monthly_brl > 100
             ),
             'never_run': idle_analysis.category == JobCategory.NEVER_RUN,
             'naming_issues': len(code_analysis.naming_issues) > 0,  # Now works correctly
             'dev_in_prod': (
-                tags_info.environment in ['dev', 'test'] or 
+                tags_info.environment in _NON_PROD_ENVIRONMENTS or 
                 'test' in job_details.get('Name', '').lower()
             )
         }
\ No newline at end of file
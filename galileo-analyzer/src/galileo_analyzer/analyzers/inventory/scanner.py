@@ -1,35 +1,76 @@
 import concurrent.futures
+import logging
+import multiprocessing
+import os
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from ...core.models import JobAnalysisResult
-from ...providers.aws.glue import GlueProvider
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Sized
+from ...core.models import JobAnalysisResult, JobConfig
+from ...providers.aws.glue import GlueProvider, BATCH_GET_JOBS_LIMIT
 from .categorizer import JobCategorizer
 from ...reporting.cost_calculator import CostCalculator
 from ...utils.aws_utils import extract_tags_info
 from ..static.quick_analyzer import QuickCodeAnalyzer
 from ...utils.logger import setup_logger
-from ...core.models import JobConfig
+
+# Log scan progress every this many analyzed jobs
+_PROGRESS_INTERVAL = 100
+
+# Start method for analysis worker processes: fork() would copy the running fetch threads
+# and boto3 connection pools, which can deadlock the child
+_PROCESS_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# Scanner used by _analyze_chunk_in_worker, created once per worker process
+_worker_scanner = None
+
+def _init_worker(log_level: int):
+    """Process pool initializer: build the worker's scanner logging at the parent's level"""
+    global _worker_scanner
+    # Workers are fresh processes, so the level the CLI configured has to be passed in
+    setup_logger("galileo.inventory", level=logging.getLevelName(log_level))
+    _worker_scanner = InventoryScanner(provider=None)
+
+def _analyze_chunk_in_worker(chunk: List[tuple]) -> List[tuple]:
+    """Process pool entry point: analyze (job_name, job_details, job_runs) items into (job_name, result, error)"""
+    outcomes = []
+    for job_name, job_details, job_runs in chunk:
+        try:
+            outcomes.append((job_name, _worker_scanner._analyze_job_data(job_name, job_details, job_runs), None))
+        except Exception as e:
+            outcomes.append((job_name, None, e))
+    return outcomes
 
 class InventoryScanner:
     
-    def __init__(self, provider: GlueProvider):
+    def __init__(self, provider: GlueProvider, max_concurrency: int = 50, prefetch_distance: int = 15,
+                 process_pool_threshold: int = 5000, process_chunksize: int = 64):
         self.provider = provider
+        self.max_concurrency = max(1, max_concurrency)
+        self.prefetch_distance = max(1, prefetch_distance)
+        # Scans at least this large run the CPU-bound analysis in a process pool
+        self.process_pool_threshold = process_pool_threshold
+        self.process_chunksize = max(1, process_chunksize)
         self.categorizer = JobCategorizer()
         self.cost_calculator = CostCalculator()
         self.code_analyzer = QuickCodeAnalyzer()
         self.logger = setup_logger("galileo.inventory")
     
-    def analyze_job_preliminary(self, job_name: str) -> JobAnalysisResult:
-        """Preliminary analysis of a job"""
-        self.logger.debug(f"Starting preliminary analysis for job: {job_name}")
+    def analyze_job_preliminary(self, job_name: str, job_details: Optional[Dict[str, Any]] = None) -> JobAnalysisResult:
+        """Preliminary analysis of a job, reusing job_details when already fetched"""
+        self.logger.debug("Starting preliminary analysis for job: %s", job_name)
         
-        job_details = self.provider.get_job_details(job_name)
+        if job_details is None:
+            job_details = self.provider.get_job_details(job_name)
+        job_runs = self.provider.get_recent_runs(job_name)
+        return self._analyze_job_data(job_name, job_details, job_runs)
+    
+    def _analyze_job_data(self, job_name: str, job_details: Dict[str, Any],
+                          job_runs: List[Dict[str, Any]]) -> JobAnalysisResult:
+        """Run the preliminary analyses over already-fetched job data"""
         if not job_details:
-            self.logger.error(f"Could not fetch job details for {job_name}")
+            self.logger.error("Could not fetch job details for %s", job_name)
             raise Exception(f'Could not fetch job details for {job_name}')
         
-        job_runs = self.provider.get_recent_runs(job_name)
-        self.logger.debug(f"Retrieved {len(job_runs)} recent runs for job: {job_name}")
+        self.logger.debug("Retrieved %d recent runs for job: %s", len(job_runs), job_name)
         
         # Independent analyses
         idle_analysis = self.categorizer.categorize_by_idle_time(job_details, job_runs)
@@ -42,7 +83,7 @@ class InventoryScanner:
             job_details, job_runs, cost_estimate, idle_analysis, code_analysis, tags_info
         )
         
-        self.logger.info(f"Completed preliminary analysis for {job_name}: {idle_analysis.category.value}")
+        self.logger.debug("Completed preliminary analysis for %s: %s", job_name, idle_analysis.category.value)
         
         return JobAnalysisResult(
             job_name=job_name,
@@ -57,40 +98,152 @@ class InventoryScanner:
         )
     def _extract_job_config(self, job_details: Dict[str, Any]) -> JobConfig:
         """Extract job configuration from job details"""
-        
+        get = job_details.get
         return JobConfig(
-            glue_version=job_details.get('GlueVersion'),
-            worker_type=job_details.get('WorkerType'),
-            number_of_workers=job_details.get('NumberOfWorkers'),
-            timeout=job_details.get('Timeout'),
-            max_retries=job_details.get('MaxRetries')
+            glue_version=get('GlueVersion'),
+            worker_type=get('WorkerType'),
+            number_of_workers=get('NumberOfWorkers'),
+            timeout=get('Timeout'),
+            max_retries=get('MaxRetries')
         )
 
-    def scan_jobs(self, job_names: Optional[List[str]] = None) -> List[JobAnalysisResult]:
-        """Execute parallel scan"""
-        if job_names is None:
-            job_names = self.provider.get_all_jobs()
-        
-        self.logger.info(f"Starting scan of {len(job_names)} jobs (preliminary analysis)...")
+    def scan_jobs(self, job_names: List[str]) -> List[JobAnalysisResult]:
+        """Execute parallel scan over an already listed (and filtered) set of jobs"""
+        return list(self.iter_scan_jobs(job_names))
+    
+    def iter_scan_jobs(self, job_names: Iterable[str]) -> Iterator[JobAnalysisResult]:
+        """Execute parallel scan, yielding each result as soon as it is ready"""
+        # job_names may be lazy (e.g. GlueProvider.iter_all_jobs()): fetching then starts
+        # while the listing is still paginating, and the total is unknown up front
+        total = len(job_names) if isinstance(job_names, Sized) else None
+        total_label = '?' if total is None else total
+        self.logger.info("Starting scan of %s jobs (preliminary analysis)...", total_label)
         
-        results = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_job = {
-                executor.submit(self.analyze_job_preliminary, job_name): job_name 
-                for job_name in job_names
-            }
+        analyzed = 0
+        failed = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            prefetched = self._prefetch_job_data(executor, job_names)
+            # Process workers only pay off once the analysis outweighs pickling overhead
+            if total is not None and total >= self.process_pool_threshold and (os.cpu_count() or 1) > 1:
+                analyses = self._analyze_in_processes(prefetched)
+            else:
+                analyses = self._analyze_in_thread(prefetched)
             
-            for future in concurrent.futures.as_completed(future_to_job):
+            for job_name, result, error in analyses:
+                if error is not None:
+                    self.logger.error("Error analyzing %s: %s", job_name, error)
+                    failed += 1
+                    continue
+                
+                analyzed += 1
+                self.logger.debug(
+                    "  %s: %s | R$ %.2f/month", result.job_name,
+                    result.idle_analysis.category.value, result.cost_estimate.estimated_monthly_brl
+                )
+                if analyzed % _PROGRESS_INTERVAL == 0:
+                    self.logger.info("Progress: %d/%s jobs analyzed", analyzed, total_label)
+                yield result
+        
+        self.logger.info("Scan completed. Successfully analyzed %d out of %d jobs", analyzed, analyzed + failed)
+    
+    def _analyze_in_thread(self, prefetched: Iterator[tuple]):
+        """Yield (job_name, result, error) analyzing each prefetched job in this thread"""
+        for job_name, details_future, runs_future in prefetched:
+            try:
+                result = self._analyze_job_data(
+                    job_name, details_future.result().get(job_name), runs_future.result()
+                )
+            except Exception as e:
+                yield job_name, None, e
+                continue
+            yield job_name, result, None
+    
+    def _analyze_in_processes(self, prefetched: Iterator[tuple]):
+        """Yield (job_name, result, error) analyzing prefetched jobs in a process pool"""
+        workers = os.cpu_count() or 1
+        # Jobs are shipped in chunks to amortize pickling/IPC per task, and queued chunks
+        # are bounded so fetched job data does not pile up in memory
+        max_pending = workers * 2
+        pending = set()
+        chunk = []
+        
+        def collect(futures):
+            for future in futures:
+                pending.discard(future)
+                yield from future.result()
+        
+        mp_context = multiprocessing.get_context(_PROCESS_START_METHOD)
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, mp_context=mp_context,
+            initializer=_init_worker, initargs=(self.logger.getEffectiveLevel(),)
+        ) as process_executor:
+            for job_name, details_future, runs_future in prefetched:
                 try:
-                    result = future.result()
-                    results.append(result)
-                    
-                    category = result.idle_analysis.category.value
-                    cost = result.cost_estimate.estimated_monthly_brl
-                    self.logger.debug(f"  {result.job_name}: {category} | R$ {cost:.2f}/month")
+                    job_details = details_future.result().get(job_name)
+                    job_runs = runs_future.result()
                 except Exception as e:
-                    job_name = future_to_job[future]
-                    self.logger.error(f"Error analyzing {job_name}: {e}")
+                    yield job_name, None, e
+                    continue
+                
+                chunk.append((job_name, job_details, job_runs))
+                if len(chunk) < self.process_chunksize:
+                    continue
+                pending.add(process_executor.submit(_analyze_chunk_in_worker, chunk))
+                chunk = []
+                if len(pending) >= max_pending:
+                    done, _ = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    yield from collect(done)
+            
+            if chunk:
+                pending.add(process_executor.submit(_analyze_chunk_in_worker, chunk))
+            yield from collect(list(pending))
+    
+    def _prefetch_job_data(self, executor: concurrent.futures.Executor, job_names: Iterable[str]):
+        """Yield (job_name, batch_details_future, runs_future) as each job's AWS data arrives"""
+        # Keep enough jobs in flight to occupy every worker plus prefetch_distance jobs
+        # ahead of the analysis loop: the next jobs' API calls overlap the current
+        # analysis while memory stays bounded
+        max_in_flight = self.max_concurrency + self.prefetch_distance
+        # Job details come from one BatchGetJobs call per batch; recent runs have no
+        # batch API, so they are still fetched per job
+        batch_size = min(BATCH_GET_JOBS_LIMIT, max_in_flight)
+        job_iter = iter(job_names)
+        pending = {}
+        future_to_jobs = {}
+        
+        def fill():
+            # Only start a new batch once a full one fits, so batches stay large
+            while len(pending) + batch_size <= max_in_flight:
+                batch = []
+                while len(batch) < batch_size:
+                    job_name = next(job_iter, None)
+                    if job_name is None:
+                        break
+                    if job_name not in pending and job_name not in batch:
+                        batch.append(job_name)
+                if not batch:
+                    return
+                
+                details_future = executor.submit(self.provider.batch_get_job_details, batch)
+                future_to_jobs[details_future] = batch
+                for job_name in batch:
+                    runs_future = executor.submit(self.provider.get_recent_runs, job_name)
+                    pending[job_name] = (details_future, runs_future)
+                    future_to_jobs[runs_future] = (job_name,)
         
-        self.logger.info(f"Scan completed. Successfully analyzed {len(results)} out of {len(job_names)} jobs")
-        return results
\ No newline at end of file
+        fill()
+        while future_to_jobs:
+            done, _ = concurrent.futures.wait(
+                future_to_jobs, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                for job_name in future_to_jobs.pop(future):
+                    futures = pending.get(job_name)
+                    # Yield once both of the job's calls are done
+                    if futures is None or not all(f.done() for f in futures):
+                        continue
+                    del pending[job_name]
+                    yield (job_name, *futures)
+            fill()
@@ -1,8 +1,29 @@
 import re
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any
 from ...utils.validators import validate_job_name
 from ...core.models import QuickCodeAnalysis
 
+# (label, keywords) in precedence order: the first category matched wins
+_PURPOSES = (
+    ('ETL Pipeline', frozenset((
+        'etl', 'extract', 'extraction', 'transform', 'transformation', 'load', 'pipeline'
+    ))),
+    ('Analytics/Reporting', frozenset((
+        'report', 'analytics', 'agg', 'aggregate', 'aggregation', 'dashboard', 'metric'
+    ))),
+    ('Data Quality', frozenset(('clean', 'quality', 'validate', 'validation', 'check', 'audit'))),
+    ('Development/Testing', frozenset(('test', 'dev', 'temp', 'tmp', 'debug', 'sample'))),
+    ('Machine Learning', frozenset(('model', 'train', 'predict', 'prediction', 'ml', 'ai', 'feature'))),
+    ('Data Migration', frozenset(('migrate', 'migration', 'import', 'export', 'sync'))),
+)
+# Keywords are matched against whole name tokens so e.g. 'getlatest' no longer counts as 'etl';
+# a token may also carry one of these suffixes ('reports', 'loader', 'training', 'validated')
+_INFLECTION_SUFFIXES = ('s', 'es', 'ing', 'er', 'ed')
+# camelCase / PascalCase word boundaries ('CustomerETLJob' -> 'Customer ETL Job')
+_CAMEL_CASE_BOUNDARY_RE = re.compile(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
+_NAME_TOKEN_SPLIT_RE = re.compile(r'[_\-./\s]+')
+
 class QuickCodeAnalyzer:
     """Quick code analysis without downloading scripts"""
     
@@ -19,32 +40,20 @@ class QuickCodeAnalyzer:
             naming_issues=validate_job_name(job_name)
         )
     
-    def _infer_purpose_from_name(self, job_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _infer_purpose_from_name(job_name: str) -> str:
         """Infer job purpose from its name"""
-        name_lower = job_name.lower()
-        
-        # ETL patterns
-        if any(term in name_lower for term in ['etl', 'extract', 'transform', 'load', 'pipeline']):
-            return 'ETL Pipeline'
-        
-        # Analytics patterns
-        if any(term in name_lower for term in ['report', 'analytics', 'agg', 'dashboard', 'metric']):
-            return 'Analytics/Reporting'
-        
-        # Data Quality patterns
-        if any(term in name_lower for term in ['clean', 'quality', 'validate', 'check', 'audit']):
-            return 'Data Quality'
-        
-        # Development/Testing patterns
-        if any(term in name_lower for term in ['test', 'dev', 'temp', 'tmp', 'debug', 'sample']):
-            return 'Development/Testing'
-        
-        # ML patterns
-        if any(term in name_lower for term in ['model', 'train', 'predict', 'ml', 'ai', 'feature']):
-            return 'Machine Learning'
-        
-        # Migration patterns
-        if any(term in name_lower for term in ['migrate', 'migration', 'import', 'export', 'sync']):
-            return 'Data Migration'
-        
-        return 'Unknown'
\ No newline at end of file
+        words = _CAMEL_CASE_BOUNDARY_RE.sub(' ', job_name).lower()
+        forms = set()
+        for token in _NAME_TOKEN_SPLIT_RE.split(words):
+            forms.add(token)
+            for suffix in _INFLECTION_SUFFIXES:
+                if token.endswith(suffix) and len(token) > len(suffix) + 1:
+                    stem = token[:-len(suffix)]
+                    # 'validated' / 'migrating' drop the keyword's final 'e'
+                    forms.update((stem, stem + 'e'))
+        for label, keywords in _PURPOSES:
+            if not keywords.isdisjoint(forms):
+                return label
+        return 'Unknown'
@@ -1,11 +1,18 @@
 import argparse
 import re
-import os
 from ..providers.factory import ProviderFactory
 from ..core.config import AWSCredentials
 from ..analyzers.inventory.scanner import InventoryScanner
 from ..reporting.formatters import ReportGenerator
 from ..core.exceptions import AuthenticationError, ConfigurationError
+from ..utils.cache import DiskCache
+from ..utils.logger import setup_logger
+
+try:
+    # RE2 matches in linear time, so a pathological --job-filter cannot backtrack forever
+    import re2
+except ImportError:
+    re2 = None
 
 def main():
     parser = argparse.ArgumentParser(description='Galileo - Cloud Data Jobs Inventory Analysis')
@@ -24,32 +31,51 @@ def main():
     # General arguments
     parser.add_argument('--job-filter', help='Regex to filter jobs')
     parser.add_argument('--output-dir', default='reports', help='Output directory for reports')
+    parser.add_argument('--max-concurrency', type=int, default=50,
+                       help='Maximum concurrent provider API calls (default: 50)')
+    parser.add_argument('--prefetch-distance', type=int, default=15,
+                       help='Number of jobs to fetch ahead of analysis (default: 15)')
+    parser.add_argument('--cache-ttl', type=int, default=3600,
+                       help='Seconds to reuse cached job details between runs (default: 3600)')
+    parser.add_argument('--pretty-json', action='store_true',
+                       help='Indent the JSON report for reading (default: compact)')
+    parser.add_argument('--verbose', action='store_true', help='Log a line for every analyzed job')
+    parser.add_argument('--no-cache', action='store_true', help='Always fetch job details from the provider')
     
     args = parser.parse_args()
+    setup_logger("galileo.providers", level="INFO")
+    # Per-job analysis lines are DEBUG; default runs only log start, progress and completion
+    setup_logger("galileo.inventory", level="DEBUG" if args.verbose else "INFO")
     
     try:
         # Create credentials based on provider
         if args.provider == 'aws':
             credentials = create_aws_credentials(args)
-            provider = ProviderFactory.create_aws_provider(credentials)
+            cache = None if args.no_cache else DiskCache(ttl_seconds=args.cache_ttl)
+            provider = ProviderFactory.create_aws_provider(
+                credentials, cache=cache, max_workers=args.max_concurrency
+            )
         else:
             raise ConfigurationError(f"Provider {args.provider} not yet implemented")
         
         # Initialize scanner
-        scanner = InventoryScanner(provider)
-        report_generator = ReportGenerator(args.output_dir)
+        scanner = InventoryScanner(
+            provider,
+            max_concurrency=args.max_concurrency,
+            prefetch_distance=args.prefetch_distance
+        )
+        report_generator = ReportGenerator(args.output_dir, pretty=args.pretty_json)
         
-        # Filter jobs if specified
-        all_jobs = provider.get_all_jobs()
+        # List job names up front (names only, so this is cheap): the scan size decides
+        # between in-thread and process-pool analysis and drives the progress log
+        job_names = provider.get_all_jobs()
         if args.job_filter:
-            filter_regex = re.compile(args.job_filter, re.I)
-            all_jobs = [job for job in all_jobs if filter_regex.search(job)]
-            print(f"Filter applied: {len(all_jobs)} jobs selected")
+            filter_regex = compile_job_filter(args.job_filter)
+            job_names = [job for job in job_names if filter_regex.search(job)]
+            print(f"Filter applied: {len(job_names)} jobs selected")
         
-        # Execute analysis
-        results = scanner.scan_jobs(all_jobs)
-        
-        # Generate and save reports
+        # Execute analysis, streaming each result into the reports as it completes
+        results = scanner.iter_scan_jobs(job_names)
         report_generator.generate_and_save_reports(results, args.provider, provider.region)
         
     except (AuthenticationError, ConfigurationError) as e:
@@ -59,6 +85,15 @@ def main():
         print(f"Unexpected error: {e}")
         exit(1)
 
+def compile_job_filter(pattern: str):
+    """Compile the case-insensitive job filter, preferring RE2 when it is installed"""
+    if re2 is not None:
+        try:
+            return re2.compile(f'(?i){pattern}')
+        except re2.error:
+            pass  # Syntax RE2 does not support (e.g. backreferences), use the re module
+    return re.compile(pattern, re.I)
+
 def create_aws_credentials(args) -> AWSCredentials:
     """Create AWS credentials from command line arguments"""
     
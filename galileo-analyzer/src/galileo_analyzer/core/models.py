@@ -1,6 +1,7 @@
+import sys
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Any, Dict, List, Optional
 from enum import Enum
 
 class JobCategory(Enum):
@@ -16,44 +17,76 @@ class Priority(Enum):
     HIGH = "HIGH"
     CRITICAL = "CRITICAL"
 
-@dataclass
-class JobConfig:
+class _Model:
+    """Base for result models: shallow to_dict() without dataclasses.asdict's deep copy"""
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dict; nested models recurse, enums and datetimes become strings"""
+        data = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if isinstance(value, _Model):
+                value = value.to_dict()
+            elif isinstance(value, Enum):
+                value = value.value
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            data[name] = value
+        return data
+
+@dataclass(slots=True, frozen=True)
+class JobConfig(_Model):
     glue_version: Optional[str] = None
     worker_type: Optional[str] = None
     number_of_workers: Optional[int] = None
     timeout: Optional[int] = None
     max_retries: Optional[int] = None
+    
+    def __post_init__(self):
+        # Low-cardinality values repeated across jobs: share one string object each
+        for name in ('glue_version', 'worker_type'):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, sys.intern(value))
 
-@dataclass
-class IdleAnalysis:
+@dataclass(slots=True, frozen=True)
+class IdleAnalysis(_Model):
     category: JobCategory
     days_idle: int
     priority: Priority
     last_run_status: Optional[str] = None
 
-@dataclass
-class CostEstimate:
+@dataclass(slots=True, frozen=True)
+class CostEstimate(_Model):
     hourly_cost_usd: float
     estimated_monthly_usd: float
     estimated_monthly_brl: float
 
-@dataclass
-class TagsInfo:
+@dataclass(slots=True, frozen=True)
+class TagsInfo(_Model):
     environment: str = 'unknown'
     team: str = 'unknown'
     business_domain: str = 'unknown'
     criticality: str = 'unknown'
     owner: str = 'unknown'
+    
+    def __post_init__(self):
+        # Tag values come from a small vocabulary: share one string object each
+        for name in ('environment', 'team', 'business_domain', 'criticality', 'owner'):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, sys.intern(value))
 
-@dataclass
-class QuickCodeAnalysis:
+@dataclass(slots=True, frozen=True)
+class QuickCodeAnalysis(_Model):
     has_script: bool
     script_location: str
     inferred_purpose: str
     naming_issues: List[str]
 
-@dataclass
-class JobAnalysisResult:
+@dataclass(slots=True, frozen=True)
+class JobAnalysisResult(_Model):
     job_name: str
     timestamp: Optional[datetime]
     job_config: JobConfig
@@ -1,41 +1,60 @@
+import logging
+import threading
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
-from typing import Dict, List, Any, Optional
-from ..base import BaseCloudProvider
+from typing import Dict, Iterator, List, Any, Optional
+from ..base import BaseCloudProvider, require_auth
 from ...core.config import AWSCredentials
 from ...core.exceptions import AuthenticationError, ProviderError
+from ...utils.cache import DiskCache, MemoryCache
+
+logger = logging.getLogger("galileo.providers.aws")
+
+# Maximum number of job names accepted by a single BatchGetJobs request
+BATCH_GET_JOBS_LIMIT = 25
 
 class GlueProvider(BaseCloudProvider):
     
-    def __init__(self, credentials: AWSCredentials):
+    __slots__ = (
+        'region', 'cache', '_memory_cache', 'max_workers', '_job_names',
+        'glue', 's3', 'cloudwatch'
+    )
+    
+    # Process-wide boto3 sessions and clients, keyed by credentials (and service/pool size)
+    _SESSION_CACHE: Dict[tuple, boto3.Session] = {}
+    _CLIENT_CACHE: Dict[tuple, Any] = {}
+    _SHARED_LOCK = threading.Lock()
+    
+    def __init__(self, credentials: AWSCredentials, cache: Optional[DiskCache] = None,
+                 max_workers: int = 50, cache_ttl_seconds: Optional[int] = None):
         super().__init__(credentials)
         self.region = credentials.region
+        self.cache = cache
+        # In-process cache of details and runs for jobs re-queried during a run (off by default)
+        self._memory_cache = MemoryCache(cache_ttl_seconds) if cache_ttl_seconds else None
+        self.max_workers = max(1, max_workers)
+        self._job_names: Optional[List[str]] = None
         self.authenticate()
     
     def authenticate(self) -> bool:
         """Authenticate with AWS and create clients"""
         try:
             creds = self.credentials
+            session_key = (
+                creds.profile, creds.region, creds.access_key_id,
+                creds.secret_access_key, creds.session_token
+            )
             
-            if creds.profile:
-                # Use AWS CLI profile
-                session = boto3.Session(
-                    profile_name=creds.profile,
-                    region_name=creds.region
-                )
-            else:
-                # Use explicit credentials
-                session = boto3.Session(
-                    aws_access_key_id=creds.access_key_id,
-                    aws_secret_access_key=creds.secret_access_key,
-                    aws_session_token=creds.session_token,
-                    region_name=creds.region
-                )
-            
-            # Create clients
-            self.glue = session.client('glue')
-            self.s3 = session.client('s3')
-            self.cloudwatch = session.client('cloudwatch')
+            # Sessions and clients are expensive to build (credential resolution, service
+            # models), so providers created with the same credentials reuse them
+            with GlueProvider._SHARED_LOCK:
+                session = GlueProvider._SESSION_CACHE.get(session_key)
+                if session is None:
+                    session = GlueProvider._SESSION_CACHE[session_key] = self._create_session(creds)
+                self.glue = self._shared_client(session_key, session, 'glue')
+                self.s3 = self._shared_client(session_key, session, 's3')
+                self.cloudwatch = self._shared_client(session_key, session, 'cloudwatch')
             
             # Test authentication
             self._test_authentication()
@@ -48,94 +67,176 @@ class GlueProvider(BaseCloudProvider):
         except Exception as e:
             raise ProviderError(f"Error initializing AWS provider: {str(e)}")
     
+    @staticmethod
+    def _create_session(creds: AWSCredentials) -> boto3.Session:
+        """Create a boto3 session from a CLI profile or explicit credentials"""
+        if creds.profile:
+            # Use AWS CLI profile
+            return boto3.Session(
+                profile_name=creds.profile,
+                region_name=creds.region
+            )
+        
+        # Use explicit credentials
+        return boto3.Session(
+            aws_access_key_id=creds.access_key_id,
+            aws_secret_access_key=creds.secret_access_key,
+            aws_session_token=creds.session_token,
+            region_name=creds.region
+        )
+    
+    def _shared_client(self, session_key: tuple, session: boto3.Session, service: str):
+        """Return the cached client for a session/service/pool size (caller holds _SHARED_LOCK)"""
+        client_key = (session_key, service, self.max_workers)
+        client = GlueProvider._CLIENT_CACHE.get(client_key)
+        if client is None:
+            # Each client is shared by all worker threads, so size its connection pool to
+            # max_workers; adaptive retries back off when concurrent calls hit the
+            # service's API rate limits
+            client = session.client(service, config=Config(
+                max_pool_connections=self.max_workers,
+                retries={'max_attempts': 10, 'mode': 'adaptive'},
+                tcp_keepalive=True
+            ))
+            GlueProvider._CLIENT_CACHE[client_key] = client
+        return client
+    
     def _test_authentication(self):
         """Test if credentials are valid by making a simple API call"""
         try:
             # FIXED: Use JobNames field
             response = self.glue.list_jobs(MaxResults=1)
             job_names = response.get('JobNames', [])
-            print(f"Authentication test successful - found {len(job_names)} jobs in first page")
+            logger.info("Authentication test successful - found %d jobs in first page", len(job_names))
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ['InvalidUserID.NotFound', 'AccessDenied', 'UnauthorizedOperation']:
                 raise AuthenticationError(f"Invalid AWS credentials: {error_code}")
             raise
     
-    def get_all_jobs(self) -> List[str]:
-        """List all Glue jobs with proper pagination"""
-        if not self.is_authenticated():
-            raise AuthenticationError("Provider not authenticated")
+    @require_auth
+    def get_all_jobs(self, max_items: Optional[int] = None) -> List[str]:
+        """List all Glue jobs (the full listing is fetched once per provider)"""
+        if max_items is None and self._job_names is not None:
+            return list(self._job_names)
         
-        all_job_names = []
-        next_token = None
-        page_count = 0
+        job_names = list(self.iter_all_jobs(max_items))
+        if max_items is None:
+            self._job_names = job_names
+        return list(job_names)
+
+    @require_auth
+    def iter_all_jobs(self, max_items: Optional[int] = None) -> Iterator[str]:
+        """Yield Glue job names as each page is listed, stopping after max_items if given"""
+        pagination = {'PageSize': 100}
+        if max_items is not None:
+            pagination['MaxItems'] = max_items
         
+        total = 0
         try:
-            while True:
-                page_count += 1
-                
-                # Build request parameters
-                params = {'MaxResults': 100}
-                if next_token:
-                    params['NextToken'] = next_token
-                
-                # Make API call
-                response = self.glue.list_jobs(**params)
-                
-                # FIXED: Use JobNames instead of Jobs
-                page_jobs = response.get('JobNames', [])
-                all_job_names.extend(page_jobs)
-                
-                print(f"Retrieved page {page_count}: {len(page_jobs)} jobs (total: {len(all_job_names)})")
-                
-                # Check for next page
-                next_token = response.get('NextToken')
-                if not next_token:
-                    break
-                    
-                # Safety break
-                if page_count > 50:
-                    print(f"Warning: Stopped after {page_count} pages")
-                    break
-            
-            print(f"Pagination complete: {len(all_job_names)} total jobs found")
-            return all_job_names
-            
+            pages = self.glue.get_paginator('list_jobs').paginate(PaginationConfig=pagination)
+            for page_count, page in enumerate(pages, 1):
+                page_jobs = page.get('JobNames', [])
+                total += len(page_jobs)
+                logger.debug("Retrieved page %d: %d jobs (total: %d)", page_count, len(page_jobs), total)
+                yield from page_jobs
         except ClientError as e:
             raise ProviderError(f"Failed to list jobs: {str(e)}")
+        
+        logger.info("Pagination complete: %d total jobs found", total)
 
+    @require_auth
     def get_job_details(self, job_name: str) -> Dict[str, Any]:
         """Get detailed job information"""
-        if not self.is_authenticated():
-            raise AuthenticationError("Provider not authenticated")
+        cached = self._get_cached_job(job_name)
+        if cached is not None:
+            return cached
         
         try:
             response = self.glue.get_job(JobName=job_name)
-            return response['Job']
+            job = response['Job']
         except ClientError as e:
             if e.response['Error']['Code'] == 'EntityNotFoundException':
                 raise ProviderError(f"Job '{job_name}' not found")
             raise ProviderError(f"Failed to get job details: {str(e)}")
+        
+        self._set_cached_job(job_name, job)
+        return job
 
+    @require_auth
+    def batch_get_job_details(self, job_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get detailed information for several jobs, keyed by name; unknown jobs are omitted"""
+        jobs = {}
+        uncached = []
+        for job_name in job_names:
+            cached = self._get_cached_job(job_name)
+            if cached is not None:
+                jobs[job_name] = cached
+            else:
+                uncached.append(job_name)
+        
+        try:
+            for start in range(0, len(uncached), BATCH_GET_JOBS_LIMIT):
+                response = self.glue.batch_get_jobs(JobNames=uncached[start:start + BATCH_GET_JOBS_LIMIT])
+                for job in response.get('Jobs', []):
+                    jobs[job['Name']] = job
+                    self._set_cached_job(job['Name'], job)
+        except ClientError as e:
+            raise ProviderError(f"Failed to get job details: {str(e)}")
+        
+        return jobs
+
+    def _cache_key(self, operation: str, job_name: str) -> tuple:
+        """Build a cache key scoped to the account/identity and region in use"""
+        creds = self.credentials
+        return (operation, self.region, creds.profile, creds.access_key_id, job_name)
+
+    def _get_cached_job(self, job_name: str) -> Optional[Dict[str, Any]]:
+        """Return cached job details from memory, then from disk, or None"""
+        if self._memory_cache is not None:
+            job = self._memory_cache.get(('get_job', job_name))
+            if job is not None:
+                return job
+        if self.cache is not None:
+            job = self.cache.get(self._cache_key('get_job', job_name))
+            if job is not None and self._memory_cache is not None:
+                self._memory_cache.set(('get_job', job_name), job)
+            return job
+        return None
+
+    def _set_cached_job(self, job_name: str, job: Dict[str, Any]) -> None:
+        """Store job details in every enabled cache"""
+        if self._memory_cache is not None:
+            self._memory_cache.set(('get_job', job_name), job)
+        if self.cache is not None:
+            self.cache.set(self._cache_key('get_job', job_name), job)
+
+    def invalidate(self, job_name: str) -> None:
+        """Forget cached details and runs for a job so the next call refetches them"""
+        if self._memory_cache is not None:
+            self._memory_cache.delete(('get_job', job_name))
+            self._memory_cache.delete(('get_job_runs', job_name))
+        if self.cache is not None:
+            self.cache.delete(self._cache_key('get_job', job_name))
+
+    @require_auth
     def get_recent_runs(self, job_name: str, max_results: int = 5) -> List[Dict[str, Any]]:
         """Get recent job executions"""
-        if not self.is_authenticated():
-            raise AuthenticationError("Provider not authenticated")
+        # Runs are cached together with the max_results they were fetched with, so a
+        # cached entry also serves any smaller request
+        if self._memory_cache is not None:
+            cached = self._memory_cache.get(('get_job_runs', job_name))
+            if cached is not None and cached[0] >= max_results:
+                return cached[1][:max_results]
         
         try:
             response = self.glue.get_job_runs(JobName=job_name, MaxResults=max_results)
-            return response['JobRuns']
+            runs = response['JobRuns']
         except ClientError as e:
             if e.response['Error']['Code'] == 'EntityNotFoundException':
                 return []  # Job exists but no runs
             raise ProviderError(f"Failed to get job runs: {str(e)}")
-
-    def _extract_job_config(self, job_details: Dict[str, Any]):
-        """Extract job configuration from job details"""
-        return JobConfig(
-            glue_version=job_details.get('GlueVersion'),
-            worker_type=job_details.get('WorkerType'),
-            number_of_workers=job_details.get('NumberOfWorkers'),
-            timeout=job_details.get('Timeout'),
-            max_retries=job_details.get('MaxRetries')
-        )
\ No newline at end of file
+        
+        if self._memory_cache is not None:
+            self._memory_cache.set(('get_job_runs', job_name), (max_results, runs))
+        return runs
@@ -1,10 +1,23 @@
 from abc import ABC, abstractmethod
+from functools import wraps
 from typing import List, Dict, Any
 from ..core.config import CloudCredentials
+from ..core.exceptions import AuthenticationError
+
+def require_auth(method):
+    """Raise AuthenticationError when a provider method is called before authenticating"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._client is None:
+            raise AuthenticationError("Provider not authenticated")
+        return method(self, *args, **kwargs)
+    return wrapper
 
 class BaseCloudProvider(ABC):
     """Base interface for all cloud providers"""
     
+    __slots__ = ('credentials', '_client')
+    
     def __init__(self, credentials: CloudCredentials):
         self.credentials = credentials
         self._client = None
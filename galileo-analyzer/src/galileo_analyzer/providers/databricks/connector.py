@@ -6,6 +6,8 @@ from ...core.exceptions import ProviderError
 class DatabricksProvider(BaseCloudProvider):
     """Placeholder Databricks provider - Not yet implemented"""
     
+    __slots__ = ()
+    
     def __init__(self, credentials: DatabricksCredentials):
         super().__init__(credentials)
         self._client = None
@@ -1,17 +1,28 @@
-from typing import Union
+from typing import Optional, Union
 from .aws.glue import GlueProvider
 from .databricks.connector import DatabricksProvider
 from .snowflake.connector import SnowflakeProvider
 from ..core.config import AWSCredentials, DatabricksCredentials, SnowflakeCredentials
 from ..core.exceptions import ConfigurationError
+from ..utils.cache import DiskCache
+
+# provider type -> (display name, credentials class, provider class)
+_FACTORIES = {
+    'aws': ('AWS', AWSCredentials, GlueProvider),
+    'databricks': ('Databricks', DatabricksCredentials, DatabricksProvider),
+    'snowflake': ('Snowflake', SnowflakeCredentials, SnowflakeProvider),
+}
 
 class ProviderFactory:
     """Factory for creating cloud providers"""
     
     @staticmethod
-    def create_aws_provider(credentials: AWSCredentials) -> GlueProvider:
+    def create_aws_provider(credentials: AWSCredentials, cache: Optional[DiskCache] = None,
+                            max_workers: int = 50, cache_ttl_seconds: Optional[int] = None) -> GlueProvider:
         """Create AWS Glue provider"""
-        return GlueProvider(credentials)
+        return GlueProvider(
+            credentials, cache=cache, max_workers=max_workers, cache_ttl_seconds=cache_ttl_seconds
+        )
     
     @staticmethod
     def create_databricks_provider(credentials: DatabricksCredentials) -> DatabricksProvider:
@@ -26,17 +37,11 @@ class ProviderFactory:
     @staticmethod
     def create_provider(provider_type: str, credentials: Union[AWSCredentials, DatabricksCredentials, SnowflakeCredentials]):
         """Create provider based on type"""
-        if provider_type.lower() == 'aws':
-            if not isinstance(credentials, AWSCredentials):
-                raise ConfigurationError("AWS provider requires AWSCredentials")
-            return ProviderFactory.create_aws_provider(credentials)
-        elif provider_type.lower() == 'databricks':
-            if not isinstance(credentials, DatabricksCredentials):
-                raise ConfigurationError("Databricks provider requires DatabricksCredentials")
-            return ProviderFactory.create_databricks_provider(credentials)
-        elif provider_type.lower() == 'snowflake':
-            if not isinstance(credentials, SnowflakeCredentials):
-                raise ConfigurationError("Snowflake provider requires SnowflakeCredentials")
-            return ProviderFactory.create_snowflake_provider(credentials)
-        else:
-            raise ConfigurationError(f"Unknown provider type: {provider_type}")
\ No newline at end of file
+        try:
+            label, credentials_class, provider_class = _FACTORIES[provider_type.lower()]
+        except KeyError:
+            raise ConfigurationError(f"Unknown provider type: {provider_type}")
+        
+        if not isinstance(credentials, credentials_class):
+            raise ConfigurationError(f"{label} provider requires {credentials_class.__name__}")
+        return provider_class(credentials)
\ No newline at end of file
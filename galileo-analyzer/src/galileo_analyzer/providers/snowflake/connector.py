@@ -6,6 +6,8 @@ from ...core.exceptions import ProviderError
 class SnowflakeProvider(BaseCloudProvider):
     """Placeholder Snowflake provider - Not yet implemented"""
     
+    __slots__ = ()
+    
     def __init__(self, credentials: SnowflakeCredentials):
         super().__init__(credentials)
         self._client = None
@@ -1,4 +1,4 @@
-from typing import Dict, List, Any
+from typing import Dict, List
 from ..core.models import CostEstimate
 
 class CostCalculator:
@@ -8,6 +8,9 @@ class CostCalculator:
         'G.4X': 1.76, 'G.8X': 3.52, 'Z.2X': 1.00
     }
     
+    # Jobs without a WorkerType (None) are priced like Standard workers
+    WORKER_COSTS_WITH_DEFAULT = {**WORKER_COSTS, None: 0.44}
+    
     USD_TO_BRL = 5.2  # Pode vir de config
     
     @classmethod
@@ -18,16 +21,20 @@ class CostCalculator:
         max_capacity = job_details.get('MaxCapacity', num_workers)
         capacity = max_capacity or num_workers
         
-        hourly_cost = cls.WORKER_COSTS.get(worker_type, 0.44) * capacity
+        hourly_cost = cls.WORKER_COSTS_WITH_DEFAULT.get(worker_type, 0.44) * capacity
         
         # Estimativa baseada em runs recentes
-        if job_runs:
-            execution_times = [run.get('ExecutionTime', 0) for run in job_runs if run.get('ExecutionTime')]
-            if execution_times:
-                avg_hours = sum(execution_times) / len(execution_times) / 3600
-                monthly_cost = hourly_cost * avg_hours * 30
-            else:
-                monthly_cost = 0
+        total_time = 0
+        run_count = 0
+        for run in job_runs:
+            execution_time = run.get('ExecutionTime')
+            if execution_time:
+                total_time += execution_time
+                run_count += 1
+        
+        if run_count:
+            avg_hours = total_time / run_count / 3600
+            monthly_cost = hourly_cost * avg_hours * 30
         else:
             monthly_cost = 0
         
@@ -35,4 +42,4 @@ class CostCalculator:
             hourly_cost_usd=hourly_cost,
             estimated_monthly_usd=monthly_cost,
             estimated_monthly_brl=monthly_cost * cls.USD_TO_BRL
-        )
\ No newline at end of file
+        )
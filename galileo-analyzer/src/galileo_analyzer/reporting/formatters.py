@@ -1,174 +1,290 @@
 import json
+import os
 import csv
+import heapq
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional, TextIO
 from ..core.models import JobAnalysisResult
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CSV_HEADER = [
+    'job_name', 'category', 'days_idle', 'priority', 'monthly_cost_brl',
+    'worker_type', 'environment', 'team', 'inferred_purpose',
+    'deep_analysis_recommended', 'deep_analysis_reasons'
+]
+
+# Report files are written through large buffers to cut write calls per result
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Fast CSV path: rows are joined in batches of this many lines before each write
+_CSV_BATCH_ROWS = 4096
+# Fields containing any of these need csv quoting, so their rows go through csv.writer
+_CSV_QUOTE_CHARS = frozenset(',"\r\n')
+
+# Line between entries of the deep analysis candidates list
+_CANDIDATE_SEPARATOR = '-' * 50
+
+# Categories whose monthly cost counts as potential savings
+_SAVINGS_CATEGORIES = frozenset(('ABANDONED', 'NEVER_RUN'))
+
 class ReportGenerator:
     """Generate reports in different formats"""
     
-    def __init__(self, output_dir: str = "reports"):
+    def __init__(self, output_dir: str = "reports", fast_csv: bool = True, pretty: bool = False):
         self.reports_dir = Path(output_dir)
         self.reports_dir.mkdir(exist_ok=True)
+        # Write CSV rows that need no quoting directly instead of through csv.writer
+        self.fast_csv = fast_csv
+        # Indent the JSON report for reading; compact output skips the pretty-printing cost
+        self.pretty = pretty
+        # Line breaks before top-level keys and before detailed results, and the space after ':'
+        self._json_key_break = '\n  ' if pretty else ''
+        self._json_item_break = '\n    ' if pretty else ''
+        self._json_colon = ': ' if pretty else ':'
     
-    def generate_and_save_reports(self, results: List[JobAnalysisResult], provider: str, region: str):
-        """Generate and save all report formats"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    def generate_and_save_reports(self, results: Iterable[JobAnalysisResult], provider: str, region: str):
+        """Generate and save all report formats, consuming results as they arrive"""
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
+        summary_builder = SummaryBuilder()
         
-        # Generate summary
-        summary = self._generate_summary(results, provider, region)
-        
-        # Create analysis data structure
-        analysis_data = {
+        # Report metadata; detailed results and the summary are appended as we go
+        metadata = {
             'analysis_type': 'preliminary',
             'provider': provider,
             'region': region,
-            'timestamp': datetime.now().isoformat(),
-            'summary': summary,
-            'detailed_results': [self._result_to_dict(result) for result in results]
+            'timestamp': now.isoformat()
         }
         
-        # Save different formats
-        self._save_json_report(analysis_data, timestamp)
-        self._save_csv_report(results, timestamp)
-        self._save_candidates_list(summary.get('deep_analysis_candidates', []), timestamp)
+        json_path = self.reports_dir / f"preliminary_analysis_{timestamp}.json"
+        csv_path = self.reports_dir / f"jobs_inventory_{timestamp}.csv"
+        # Results are streamed into temporary files that only replace the final paths once
+        # complete, so a scan that fails midway leaves no truncated reports behind
+        json_tmp_path = _temp_path(json_path)
+        csv_tmp_path = _temp_path(csv_path)
+        try:
+            with open(json_tmp_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as json_file, \
+                    open(csv_tmp_path, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as csv_file:
+                csv_writer = csv.writer(csv_file)
+                csv_writer.writerow(CSV_HEADER)
+                self._start_json_report(json_file, metadata)
+                count = 0
+                
+                def csv_rows():
+                    # Each result also goes to the summary and the JSON report on its way to the CSV
+                    nonlocal count
+                    for result in results:
+                        reasons = _deep_analysis_reasons(result)
+                        summary_builder.add(result, reasons)
+                        self._write_json_result(json_file, result, first=count == 0)
+                        count += 1
+                        yield self._csv_row(result, reasons)
+                
+                if self.fast_csv:
+                    self._write_csv_rows_fast(csv_file, csv_writer, csv_rows())
+                else:
+                    csv_writer.writerows(csv_rows())
+                summary = summary_builder.build()
+                self._finish_json_report(json_file, summary, empty=count == 0)
+        except BaseException:
+            json_tmp_path.unlink(missing_ok=True)
+            csv_tmp_path.unlink(missing_ok=True)
+            raise
+        
+        os.replace(json_tmp_path, json_path)
+        os.replace(csv_tmp_path, csv_path)
+        self._save_candidates_list(summary.get('deep_analysis_candidates', []), timestamp, now)
         
         print(f"Reports saved to {self.reports_dir}/")
         print(f"  - JSON: preliminary_analysis_{timestamp}.json")
         print(f"  - CSV: jobs_inventory_{timestamp}.csv")
         print(f"  - Candidates: deep_analysis_candidates_{timestamp}.txt")
     
-    def _generate_summary(self, results: List[JobAnalysisResult], provider: str, region: str) -> Dict[str, Any]:
-        """Generate executive summary"""
-        categories = {}
-        total_cost = 0
-        deep_analysis_candidates = []
-        
-        for result in results:
-            # Count categories
-            category = result.idle_analysis.category.value
-            categories[category] = categories.get(category, 0) + 1
-            
-            # Sum costs
-            cost = result.cost_estimate.estimated_monthly_brl
-            total_cost += cost
+    def _start_json_report(self, f: TextIO, metadata: Dict[str, Any]):
+        """Write the JSON report header up to the opening of the detailed results array"""
+        f.write('{')
+        for key, value in metadata.items():
+            encoded = json.dumps(value, default=str, ensure_ascii=False)
+            f.write(f'{self._json_key_break}{json.dumps(key)}{self._json_colon}{encoded},')
+        f.write(f'{self._json_key_break}"detailed_results"{self._json_colon}[')
+    
+    def _dumps(self, data: Any) -> str:
+        """Encode data as JSON (2-space indented if pretty), using orjson when it is installed"""
+        if orjson is not None:
+            # orjson encodes the result dataclasses, their enums and datetimes natively
+            option = orjson.OPT_INDENT_2 if self.pretty else 0
+            return orjson.dumps(data, default=str, option=option).decode('utf-8')
+        if self.pretty:
+            return json.dumps(data, indent=2, default=_json_default, ensure_ascii=False)
+        return json.dumps(data, separators=(',', ':'), default=_json_default, ensure_ascii=False)
+    
+    def _write_json_result(self, f: TextIO, result: JobAnalysisResult, first: bool):
+        """Append one detailed result to the JSON report"""
+        encoded = self._dumps(result)
+        if not first:
+            f.write(',')
+        if self.pretty:
+            f.write(self._json_item_break)
+            encoded = encoded.replace('\n', self._json_item_break)
+        f.write(encoded)
+    
+    def _finish_json_report(self, f: TextIO, summary: Dict[str, Any], empty: bool):
+        """Close the detailed results array and write the summary as the last key"""
+        encoded = self._dumps(summary)
+        if self.pretty:
+            encoded = encoded.replace('\n', self._json_key_break)
+        f.write(']' if empty else f'{self._json_key_break}]')
+        f.write(f',{self._json_key_break}"summary"{self._json_colon}')
+        f.write(encoded)
+        f.write('\n}' if self.pretty else '}')
+    
+    def _write_csv_rows_fast(self, f: TextIO, csv_writer, rows: Iterable[List[Any]]):
+        """Write CSV rows as pre-joined lines, using csv_writer only for rows that need quoting"""
+        batch = []
+        for row in rows:
+            line = _format_csv_line(row)
+            if line is None:
+                # Flush the pending lines first so rows keep their order
+                f.write(''.join(batch))
+                batch.clear()
+                csv_writer.writerow(row)
+                continue
             
-            # Find candidates for deep analysis
-            candidates = result.candidate_for_deep_analysis
-            if any(candidates.values()):
-                deep_analysis_candidates.append({
-                    'job_name': result.job_name,
-                    'reasons': [k for k, v in candidates.items() if v],
-                    'cost': cost,
-                    'category': category
-                })
+            batch.append(line)
+            if len(batch) >= _CSV_BATCH_ROWS:
+                f.write(''.join(batch))
+                batch.clear()
+        f.write(''.join(batch))
+    
+    def _csv_row(self, result: JobAnalysisResult, reasons: List[str]) -> List[Any]:
+        """Build the CSV report row for one result"""
+        idle_analysis = result.idle_analysis
+        tags_info = result.tags_info
         
-        # Calculate potential savings
-        potential_savings = sum(
-            r.cost_estimate.estimated_monthly_brl 
-            for r in results 
-            if r.idle_analysis.category.value in ['ABANDONED', 'NEVER_RUN']
+        return [
+            result.job_name,
+            idle_analysis.category.value,
+            idle_analysis.days_idle,
+            idle_analysis.priority.value,
+            result.cost_estimate.estimated_monthly_brl,
+            result.job_config.worker_type,
+            tags_info.environment,
+            tags_info.team,
+            result.code_analysis.inferred_purpose,
+            bool(reasons),
+            '; '.join(reasons)
+        ]
+    
+    def _save_candidates_list(self, candidates: List[Dict], timestamp: str, generated_at: datetime):
+        """Save list of candidates for deep analysis"""
+        candidates_path = self.reports_dir / f"deep_analysis_candidates_{timestamp}.txt"
+        parts = [
+            "# Deep Analysis Candidates\n",
+            f"# Generated at: {generated_at.strftime('%d/%m/%Y %H:%M')}\n\n"
+        ]
+        parts.extend(
+            f"Job: {candidate['job_name']}\n"
+            f"Category: {candidate['category']}\n"
+            f"Cost: R$ {candidate['cost']:.2f}/month\n"
+            f"Reasons: {', '.join(candidate['reasons'])}\n"
+            f"{_CANDIDATE_SEPARATOR}\n\n"
+            for candidate in candidates
         )
+        with open(candidates_path, 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
+
+
+def _temp_path(path: Path) -> Path:
+    """Hidden sibling of path that a report is written to before being moved into place"""
+    return path.with_name(f'.{path.name}.tmp')
+
+
+def _deep_analysis_reasons(result: JobAnalysisResult) -> List[str]:
+    """Names of the deep analysis criteria a result matched"""
+    return [k for k, v in result.candidate_for_deep_analysis.items() if v]
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback for the stdlib encoder: result models become dicts, anything else a string"""
+    to_dict = getattr(obj, 'to_dict', None)
+    return to_dict() if to_dict is not None else str(obj)
+
+
+def _format_csv_line(row: List[Any]) -> Optional[str]:
+    """Format a row exactly as csv.writer's default dialect would, or None if a field needs quoting"""
+    fields = []
+    for value in row:
+        if value is None:
+            fields.append('')
+        elif isinstance(value, str):
+            if not _CSV_QUOTE_CHARS.isdisjoint(value):
+                return None
+            fields.append(value)
+        else:
+            fields.append(str(value))
+    return ','.join(fields) + '\r\n'
+
+
+class SummaryBuilder:
+    """Accumulate the executive summary incrementally as results are produced"""
+    
+    def __init__(self):
+        self.total_jobs = 0
+        self.successful_analyses = 0
+        self.categories: Counter = Counter()
+        self.total_cost = 0
+        self.potential_savings = 0
+        self.deep_analysis_candidates: List[Dict[str, Any]] = []
+    
+    def add(self, result: JobAnalysisResult, reasons: Optional[List[str]] = None):
+        """Fold one result into the running totals, reusing its deep analysis reasons if given"""
+        self.total_jobs += 1
+        if hasattr(result, 'job_name'):
+            self.successful_analyses += 1
+        
+        # Count categories
+        category = result.idle_analysis.category.value
+        self.categories[category] += 1
+        
+        # Sum costs and potential savings
+        cost = result.cost_estimate.estimated_monthly_brl
+        self.total_cost += cost
+        if category in _SAVINGS_CATEGORIES:
+            self.potential_savings += cost
+        
+        # Find candidates for deep analysis
+        if reasons is None:
+            reasons = _deep_analysis_reasons(result)
+        if reasons:
+            self.deep_analysis_candidates.append({
+                'job_name': result.job_name,
+                'reasons': reasons,
+                'cost': cost,
+                'category': category
+            })
+    
+    def build(self) -> Dict[str, Any]:
+        """Generate executive summary"""
+        total_cost = self.total_cost
+        potential_savings = self.potential_savings
         
         return {
-            'total_jobs': len(results),
-            'successful_analyses': len([r for r in results if hasattr(r, 'job_name')]),
-            'categories_distribution': categories,
+            'total_jobs': self.total_jobs,
+            'successful_analyses': self.successful_analyses,
+            'categories_distribution': dict(self.categories),
             'cost_summary': {
                 'total_monthly_brl': round(total_cost, 2),
                 'potential_savings_brl': round(potential_savings, 2),
                 'savings_percentage': round((potential_savings / total_cost * 100) if total_cost > 0 else 0, 1)
             },
-            'deep_analysis_candidates': sorted(deep_analysis_candidates, 
-                                             key=lambda x: x['cost'], reverse=True)[:20]
-        }
-    
-    def _result_to_dict(self, result: JobAnalysisResult) -> Dict[str, Any]:
-        """Convert JobAnalysisResult to dictionary for JSON serialization"""
-        return {
-            'job_name': result.job_name,
-            'timestamp': result.timestamp.isoformat() if result.timestamp else None,
-            'job_config': {
-                'glue_version': result.job_config.glue_version,
-                'worker_type': result.job_config.worker_type,
-                'number_of_workers': result.job_config.number_of_workers,
-                'timeout': result.job_config.timeout,
-                'max_retries': result.job_config.max_retries
-            },
-            'idle_analysis': {
-                'category': result.idle_analysis.category.value,
-                'days_idle': result.idle_analysis.days_idle,
-                'priority': result.idle_analysis.priority.value,
-                'last_run_status': result.idle_analysis.last_run_status
-            },
-            'cost_estimate': {
-                'hourly_cost_usd': result.cost_estimate.hourly_cost_usd,
-                'estimated_monthly_usd': result.cost_estimate.estimated_monthly_usd,
-                'estimated_monthly_brl': result.cost_estimate.estimated_monthly_brl
-            },
-            'tags_info': {
-                'environment': result.tags_info.environment,
-                'team': result.tags_info.team,
-                'business_domain': result.tags_info.business_domain,
-                'criticality': result.tags_info.criticality,
-                'owner': result.tags_info.owner
-            },
-            'code_analysis': {
-                'has_script': result.code_analysis.has_script,
-                'script_location': result.code_analysis.script_location,
-                'inferred_purpose': result.code_analysis.inferred_purpose,
-                'naming_issues': result.code_analysis.naming_issues
-            },
-            'recent_runs_count': result.recent_runs_count,
-            'candidate_for_deep_analysis': result.candidate_for_deep_analysis
+            # Highest cost first without sorting every candidate; ties are ordered by job name
+            # since results arrive in scan completion order, which varies between runs
+            'deep_analysis_candidates': heapq.nsmallest(20, self.deep_analysis_candidates,
+                                                        key=lambda x: (-x['cost'], x['job_name']))
         }
-    
-    def _save_json_report(self, analysis_data: Dict[str, Any], timestamp: str):
-        """Save complete JSON report"""
-        json_path = self.reports_dir / f"preliminary_analysis_{timestamp}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(analysis_data, f, indent=2, default=str, ensure_ascii=False)
-    
-    def _save_csv_report(self, results: List[JobAnalysisResult], timestamp: str):
-        """Save CSV report for analysis"""
-        csv_path = self.reports_dir / f"jobs_inventory_{timestamp}.csv"
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'job_name', 'category', 'days_idle', 'priority', 'monthly_cost_brl',
-                'worker_type', 'environment', 'team', 'inferred_purpose',
-                'deep_analysis_recommended', 'deep_analysis_reasons'
-            ])
-            
-            for result in results:
-                candidates = result.candidate_for_deep_analysis
-                reasons = [k for k, v in candidates.items() if v]
-                
-                writer.writerow([
-                    result.job_name,
-                    result.idle_analysis.category.value,
-                    result.idle_analysis.days_idle,
-                    result.idle_analysis.priority.value,
-                    result.cost_estimate.estimated_monthly_brl,
-                    result.job_config.worker_type,
-                    result.tags_info.environment,
-                    result.tags_info.team,
-                    result.code_analysis.inferred_purpose,
-                    any(candidates.values()),
-                    '; '.join(reasons)
-                ])
-    
-    def _save_candidates_list(self, candidates: List[Dict], timestamp: str):
-        """Save list of candidates for deep analysis"""
-        candidates_path = self.reports_dir / f"deep_analysis_candidates_{timestamp}.txt"
-        with open(candidates_path, 'w', encoding='utf-8') as f:
-            f.write("# Deep Analysis Candidates\n")
-            f.write(f"# Generated at: {datetime.now().strftime('%d/%m/%Y %H:%M')}\n\n")
-            
-            for candidate in candidates:
-                f.write(f"Job: {candidate['job_name']}\n")
-                f.write(f"Category: {candidate['category']}\n")
-                f.write(f"Cost: R$ {candidate['cost']:.2f}/month\n")
-                f.write(f"Reasons: {', '.join(candidate['reasons'])}\n")
-                f.write("-" * 50 + "\n\n")
\ No newline at end of file
@@ -7,10 +7,14 @@ def extract_tags_info(job_details: Dict[str, Any]) -> TagsInfo:
     default_args = job_details.get('DefaultArguments', {})
     
     # Tags can be in DefaultArguments with prefix --
-    for key, value in default_args.items():
-        if key.startswith('--tag-'):
-            tag_name = key[6:]  # Remove '--tag-'
-            tags[tag_name] = value
+    argument_tags = {
+        key[6:]: value  # Remove '--tag-'
+        for key, value in default_args.items()
+        if key.startswith('--tag-')
+    }
+    if argument_tags:
+        # Merge into a new dict: job_details may be shared with the provider cache
+        tags = {**tags, **argument_tags}
     
     # CHANGE THIS: Return dataclass instead of dict
     return TagsInfo(
@@ -0,0 +1,90 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional
+
+class DiskCache:
+    """Small TTL cache that persists pickled values as files in a directory"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl_seconds: int = 3600):
+        self.cache_dir = Path(cache_dir or Path.home() / '.galileo' / 'cache')
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, key: Hashable) -> Path:
+        """Map a cache key to its file path"""
+        digest = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.pkl"
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing, expired or unreadable"""
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return default
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value; failures to write are ignored since the cache is best-effort"""
+        # Write to a temp file and rename so concurrent readers never see partial data
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def delete(self, key: Hashable) -> None:
+        """Drop a cached value if present"""
+        try:
+            self._path(key).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache whose entries expire after a TTL"""
+
+    def __init__(self, ttl_seconds: int = 300, maxsize: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Drop a cached value if present"""
+        with self._lock:
+            self._entries.pop(key, None)
@@ -1,17 +1,19 @@
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+@lru_cache(maxsize=None)
 def setup_logger(name: str = "galileo", level: str = "DEBUG", log_file: Optional[Path] = None) -> logging.Logger:
-    """Setup centralized logging for Galileo Analyzer"""
+    """Setup centralized logging for Galileo Analyzer (memoized per configuration)"""
     
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
     
-    # Avoid adding handlers multiple times
+    # Avoid adding handlers multiple times; the first configuration (e.g. the CLI's) keeps its level
     if logger.handlers:
         return logger
+    logger.setLevel(getattr(logging, level.upper()))
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -1,6 +1,12 @@
 import re
 from typing import List
 
+# Compiled once at import time instead of on every validation call
+_JOB_NAME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_-]*$')
+_AWS_REGION_RE = re.compile(r'^[a-z]{2}-[a-z]+-\d+$')
+_S3_PATH_RE = re.compile(r'^s3://[a-z0-9.-]+/.+$')
+_DEV_PATTERNS = ('test', 'tmp', 'temp', 'dev', 'debug', 'sample')
+
 def validate_job_name(job_name: str) -> List[str]:
     """Validate job naming conventions and return issues"""
     issues = []
@@ -12,14 +18,13 @@ def validate_job_name(job_name: str) -> List[str]:
         issues.append("Job name too long (more than 255 characters)")
     
     # Check for development/test patterns in production
-    dev_patterns = ['test', 'tmp', 'temp', 'dev', 'debug', 'sample']
     name_lower = job_name.lower()
-    for pattern in dev_patterns:
+    for pattern in _DEV_PATTERNS:
         if pattern in name_lower:
             issues.append(f"Development/test pattern '{pattern}' found in job name")
     
     # Check naming convention
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*$', job_name):
+    if not _JOB_NAME_RE.match(job_name):
         issues.append("Job name doesn't follow standard naming convention (should start with letter, contain only letters, numbers, underscores, hyphens)")
     
     # Check for spaces
@@ -31,11 +36,9 @@ def validate_job_name(job_name: str) -> List[str]:
 def validate_aws_region(region: str) -> bool:
     """Validate AWS region format"""
     # Basic AWS region pattern: us-east-1, eu-west-1, etc.
-    pattern = r'^[a-z]{2}-[a-z]+-\d+$'
-    return bool(re.match(pattern, region))
+    return bool(_AWS_REGION_RE.match(region))
 
 def validate_s3_path(s3_path: str) -> bool:
     """Validate S3 path format"""
     # Basic S3 path pattern: s3://bucket-name/path/to/file
-    pattern = r'^s3://[a-z0-9.-]+/.+$'
-    return bool(re.match(pattern, s3_path))
\ No newline at end of file
+    return bool(_S3_PATH_RE.match(s3_path))
\ No newline at end of file
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import pytest
+
+from galileo_analyzer.core.exceptions import ProviderError
+from galileo_analyzer.core.models import (
+    CostEstimate, IdleAnalysis, JobAnalysisResult, JobCategory, JobConfig, Priority,
+    QuickCodeAnalysis, TagsInfo
+)
+
+
+class FakeGlueProvider:
+    """In-memory stand-in for GlueProvider exposing the calls the scanner makes"""
+
+    def __init__(self, job_names: List[str], failing_jobs=(), runs_by_job=None):
+        now = datetime.now()
+        self.jobs = {
+            name: {
+                'Name': name,
+                'CreatedOn': now - timedelta(days=10),
+                'WorkerType': 'G.1X',
+                'NumberOfWorkers': 2,
+                'Command': {'ScriptLocation': f's3://scripts/{name}.py'},
+                'Tags': {'Environment': 'prod', 'Team': 'data'},
+            }
+            for name in job_names
+        }
+        # A BatchGetJobs call containing any of these jobs fails as a whole
+        self.failing_jobs = frozenset(failing_jobs)
+        self.runs_by_job = runs_by_job or {}
+        self.batches: List[List[str]] = []
+
+    def batch_get_job_details(self, job_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        self.batches.append(list(job_names))
+        if not self.failing_jobs.isdisjoint(job_names):
+            raise ProviderError("Failed to get job details: throttled")
+        return {name: self.jobs[name] for name in job_names if name in self.jobs}
+
+    def get_recent_runs(self, job_name: str, max_results: int = 5) -> List[Dict[str, Any]]:
+        return self.runs_by_job.get(job_name, [])[:max_results]
+
+
+def make_result(job_name: str, cost: float = 0.0, category: JobCategory = JobCategory.NEVER_RUN,
+                candidates: Dict[str, bool] = None, team: str = 'data') -> JobAnalysisResult:
+    """Build a JobAnalysisResult with the fields the reports read"""
+    return JobAnalysisResult(
+        job_name=job_name,
+        timestamp=datetime(2024, 5, 1, 12, 30, 15, 123456),
+        job_config=JobConfig(glue_version='4.0', worker_type='G.1X', number_of_workers=2),
+        idle_analysis=IdleAnalysis(category=category, days_idle=42, priority=Priority.HIGH),
+        cost_estimate=CostEstimate(
+            hourly_cost_usd=0.88, estimated_monthly_usd=cost / 5.2, estimated_monthly_brl=cost
+        ),
+        tags_info=TagsInfo(environment='prod', team=team),
+        code_analysis=QuickCodeAnalysis(
+            has_script=True, script_location=f's3://scripts/{job_name}.py',
+            inferred_purpose='ETL Pipeline', naming_issues=[]
+        ),
+        recent_runs_count=0,
+        candidate_for_deep_analysis=candidates or {'high_cost': False, 'never_run': False}
+    )
+
+
+@pytest.fixture
+def results() -> List[JobAnalysisResult]:
+    return [
+        make_result('daily_etl', 612.5, JobCategory.ACTIVE, {'high_cost': True, 'never_run': False}),
+        make_result('legacy_export', 150.0, JobCategory.ABANDONED, {'high_cost': False, 'never_run': False}),
+        make_result('ingestão_vendas', 0.0, JobCategory.NEVER_RUN, {'high_cost': False, 'never_run': True}),
+        make_result('team, "quoted"', 25.25, JobCategory.RECENT, team='ops\nnight'),
+    ]
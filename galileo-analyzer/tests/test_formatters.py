@@ -0,0 +1,149 @@
+import csv
+import io
+import json
+import random
+
+import pytest
+
+from galileo_analyzer.core.models import JobCategory
+from galileo_analyzer.reporting import formatters
+from galileo_analyzer.reporting.formatters import ReportGenerator, SummaryBuilder, _format_csv_line
+from .conftest import make_result
+
+
+@pytest.fixture(params=[True, False], ids=['orjson', 'stdlib-json'])
+def use_orjson(request, monkeypatch):
+    if request.param:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(formatters, 'orjson', None)
+    return request.param
+
+
+def _report_text(tmp_path, pattern):
+    (path,) = tmp_path.glob(pattern)
+    with open(path, encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def _expected_json(results, report, pretty):
+    """The report as json.dumps would encode it in one piece"""
+    summary_builder = SummaryBuilder()
+    for result in results:
+        summary_builder.add(result)
+    expected = {
+        'analysis_type': 'preliminary',
+        'provider': 'aws',
+        'region': 'sa-east-1',
+        'timestamp': report['timestamp'],
+        'detailed_results': [result.to_dict() for result in results],
+        'summary': summary_builder.build(),
+    }
+    if pretty:
+        return json.dumps(expected, indent=2, ensure_ascii=False)
+    return json.dumps(expected, separators=(',', ':'), ensure_ascii=False)
+
+
+@pytest.mark.parametrize('pretty', [True, False], ids=['pretty', 'compact'])
+def test_json_report_matches_json_dumps(tmp_path, results, use_orjson, pretty):
+    ReportGenerator(str(tmp_path), pretty=pretty).generate_and_save_reports(iter(results), 'aws', 'sa-east-1')
+
+    text = _report_text(tmp_path, 'preliminary_analysis_*.json')
+    report = json.loads(text)
+    assert [r['job_name'] for r in report['detailed_results']] == [r.job_name for r in results]
+    assert report['detailed_results'][0]['idle_analysis']['category'] == 'ACTIVE'
+    assert report['detailed_results'][0]['timestamp'] == '2024-05-01T12:30:15.123456'
+    assert text == _expected_json(results, report, pretty)
+
+
+@pytest.mark.parametrize('pretty', [True, False], ids=['pretty', 'compact'])
+def test_json_report_with_no_results(tmp_path, use_orjson, pretty):
+    ReportGenerator(str(tmp_path), pretty=pretty).generate_and_save_reports(iter([]), 'aws', 'sa-east-1')
+
+    text = _report_text(tmp_path, 'preliminary_analysis_*.json')
+    report = json.loads(text)
+    assert report['detailed_results'] == []
+    assert report['summary']['total_jobs'] == 0
+    assert report['summary']['cost_summary']['savings_percentage'] == 0
+    assert text == _expected_json([], report, pretty)
+    assert _report_text(tmp_path, 'jobs_inventory_*.csv') == ','.join(formatters.CSV_HEADER) + '\r\n'
+
+
+@pytest.mark.parametrize('fast_csv', [True, False], ids=['fast', 'csv-writer'])
+def test_csv_report_matches_csv_writer(tmp_path, results, fast_csv):
+    generator = ReportGenerator(str(tmp_path), fast_csv=fast_csv)
+    generator.generate_and_save_reports(iter(results), 'aws', 'sa-east-1')
+
+    expected = io.StringIO(newline='')
+    writer = csv.writer(expected)
+    writer.writerow(formatters.CSV_HEADER)
+    writer.writerows(
+        generator._csv_row(result, formatters._deep_analysis_reasons(result))
+        for result in results
+    )
+    text = _report_text(tmp_path, 'jobs_inventory_*.csv')
+    assert text == expected.getvalue()
+    rows = list(csv.reader(io.StringIO(text, newline='')))
+    assert rows[4][0] == 'team, "quoted"' and rows[4][7] == 'ops\nnight'
+
+
+@pytest.mark.parametrize('row', [
+    ['plain', 1, 2.5, None, True, ''],
+    ['a,b', 0, 0.1],
+    ['say "hi"', -3],
+    ['line\nbreak'],
+    ['carriage\rreturn', 1e-07],
+    [' padded ', 'ç', '; '.join(['never_run', 'high_cost'])],
+])
+def test_format_csv_line_matches_csv_writer(row):
+    expected = io.StringIO(newline='')
+    csv.writer(expected).writerow(row)
+
+    line = _format_csv_line(row)
+    if line is None:
+        assert any(char in str(value) for value in row for char in ',"\r\n')
+    else:
+        assert line == expected.getvalue()
+
+
+def test_fast_csv_writer_fuzz(tmp_path):
+    rng = random.Random(1234)
+    alphabet = 'ab ,"\r\nç;'
+    rows = [
+        [
+            ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 6))),
+            rng.randint(-5, 5000),
+            rng.random() * 1000,
+            rng.choice([None, True, False]),
+        ]
+        for _ in range(5000)
+    ]
+    expected = io.StringIO(newline='')
+    csv.writer(expected).writerows(rows)
+
+    actual = io.StringIO(newline='')
+    ReportGenerator(str(tmp_path))._write_csv_rows_fast(actual, csv.writer(actual), rows)
+    assert actual.getvalue() == expected.getvalue()
+
+
+def test_failed_scan_leaves_no_reports(tmp_path, results):
+    def failing_results():
+        yield from results[:2]
+        raise RuntimeError('scan aborted')
+
+    with pytest.raises(RuntimeError):
+        ReportGenerator(str(tmp_path)).generate_and_save_reports(failing_results(), 'aws', 'sa-east-1')
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_top_candidates_break_cost_ties_by_job_name():
+    candidates = {'never_run': True}
+    names = [f'job_{i:02d}' for i in range(30)]
+    random.Random(7).shuffle(names)
+    summary_builder = SummaryBuilder()
+    for name in names:
+        summary_builder.add(make_result(name, 10.0, JobCategory.NEVER_RUN, candidates))
+    summary_builder.add(make_result('expensive', 900.0, JobCategory.ACTIVE, candidates))
+
+    top = summary_builder.build()['deep_analysis_candidates']
+    assert [c['job_name'] for c in top] == ['expensive'] + sorted(names)[:19]
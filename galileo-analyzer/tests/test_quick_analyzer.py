@@ -0,0 +1,37 @@
+import pytest
+
+from galileo_analyzer.analyzers.static.quick_analyzer import QuickCodeAnalyzer
+
+
+@pytest.mark.parametrize('job_name, purpose', [
+    ('sales_reports', 'Analytics/Reporting'),
+    ('daily_metrics', 'Analytics/Reporting'),
+    ('DailyAggregations', 'Analytics/Reporting'),
+    ('model_training', 'Machine Learning'),
+    ('churn-predictions', 'Machine Learning'),
+    ('data_loader', 'ETL Pipeline'),
+    ('CustomerETLJob', 'ETL Pipeline'),
+    ('cleaning_job', 'Data Quality'),
+    ('orders_validated', 'Data Quality'),
+    ('XMLImporter', 'Data Migration'),
+    ('users.migrating', 'Data Migration'),
+    ('ai_scoring', 'Machine Learning'),
+])
+def test_infers_purpose_from_inflected_and_camel_case_names(job_name, purpose):
+    assert QuickCodeAnalyzer._infer_purpose_from_name(job_name) == purpose
+
+
+@pytest.mark.parametrize('job_name', [
+    'device_telemetry_ingest',
+    'template_renderer',
+    'temperature_sensor',
+    'important_customers',
+    'checkout_events',
+    'auditorium_bookings',
+    'trainee_roster',
+    'getlatest_prices',
+    'email_sender',
+    'daily_main_detail',
+])
+def test_keywords_inside_other_words_do_not_match(job_name):
+    assert QuickCodeAnalyzer._infer_purpose_from_name(job_name) == 'Unknown'
@@ -0,0 +1,66 @@
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+
+from galileo_analyzer.analyzers.inventory import scanner as scanner_module
+from galileo_analyzer.analyzers.inventory.scanner import InventoryScanner
+from galileo_analyzer.core.models import JobCategory
+from .conftest import FakeGlueProvider
+
+
+def _names_in_failed_batches(provider):
+    return {name for batch in provider.batches if not provider.failing_jobs.isdisjoint(batch) for name in batch}
+
+
+@pytest.mark.parametrize('lazy', [False, True], ids=['list', 'generator'])
+def test_scan_skips_missing_jobs_and_failed_batches(lazy):
+    job_names = [f'job_{i:02d}' for i in range(40)]
+    runs = {'job_03': [{'StartedOn': datetime.now() - timedelta(days=2), 'JobRunState': 'SUCCEEDED',
+                        'ExecutionTime': 1800}]}
+    provider = FakeGlueProvider(job_names, failing_jobs={'job_17'}, runs_by_job=runs)
+    scanner = InventoryScanner(provider, max_concurrency=4, prefetch_distance=2)
+
+    requested = job_names + ['missing_job']
+    results = list(scanner.iter_scan_jobs(iter(requested) if lazy else requested))
+
+    # Batches are bounded by the prefetch window, and every requested job is fetched once
+    assert all(len(batch) <= 6 for batch in provider.batches)
+    assert sorted(name for batch in provider.batches for name in batch) == sorted(requested)
+
+    failed = _names_in_failed_batches(provider)
+    assert 'job_17' in failed
+    expected = set(job_names) - failed
+    assert {result.job_name for result in results} == expected
+    assert len(results) == len(expected)
+
+    by_name = {result.job_name: result for result in results}
+    assert by_name['job_03'].idle_analysis.category is JobCategory.ACTIVE
+    assert by_name['job_03'].cost_estimate.estimated_monthly_brl > 0
+    assert by_name['job_00'].idle_analysis.category is JobCategory.NEVER_RUN
+
+
+def test_scan_with_no_jobs():
+    provider = FakeGlueProvider([])
+    assert InventoryScanner(provider).scan_jobs([]) == []
+    assert provider.batches == []
+
+
+def test_process_pool_scan_logs_at_parent_level(monkeypatch, capfd):
+    job_names = [f'job_{i:02d}' for i in range(12)]
+    provider = FakeGlueProvider(job_names)
+    scanner = InventoryScanner(provider, max_concurrency=4, process_pool_threshold=1, process_chunksize=5)
+    monkeypatch.setattr(scanner_module.os, 'cpu_count', lambda: 2)
+    previous_level = scanner.logger.level
+    scanner.logger.setLevel(logging.INFO)
+    try:
+        results = scanner.scan_jobs(job_names + ['missing_job'])
+    finally:
+        scanner.logger.setLevel(previous_level)
+
+    assert sorted(result.job_name for result in results) == job_names
+    output = capfd.readouterr().out
+    # The missing job is reported from inside a worker process...
+    assert 'ERROR - Could not fetch job details for missing_job' in output
+    # ...whose per-job DEBUG lines stay hidden like the parent's
+    assert ' - DEBUG - ' not in output